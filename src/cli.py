@@ -1,8 +1,9 @@
 #!/usr/bin/python3
 import sys
+from functools import lru_cache
 from typing import Tuple
 from quo.completion import NestedCompleter
-from quo.history import MemoryHistory
+from quo.history import InMemoryHistory
 from quo.prompt import Prompt
 from quo.text import Text
 
@@ -14,6 +15,11 @@ rprompt_init = 'Type any command to continue'
 rprompt_default = ''
 rprompt_error = 'Type `help` or ? for help'
 
+# parse the formatted texts only once
+rprompt_init_text = Text(rprompt_init)
+rprompt_default_text = Text(rprompt_default)
+rprompt_error_text = Text(rprompt_error)
+
 
 def main(**shell_kwds):
     shell = shell_main(repl=False, **shell_kwds)
@@ -24,21 +30,23 @@ def main(**shell_kwds):
 def setup(shell: Shell) -> Tuple[Prompt, Shell]:
     shell.ignore_invalid_syntax = False
 
+    # functions are registered at runtime, so infer the commands only once here
+    commands = tuple(all_commands(Shell))
+
     # setup a completion-dropdown
-    completer = NestedCompleter.add({k: None for k in all_commands(Shell)})
+    completer = NestedCompleter.add(dict.fromkeys(commands))
 
     # setup a history-completion
-    for cmd in all_commands(Shell):
-        MemoryHistory.append(cmd)
+    history = InMemoryHistory(commands)
 
     session = Prompt(
-        history=MemoryHistory,
+        history=history,
         suggest="history",
-        rprompt=Text(rprompt_init),
+        rprompt=rprompt_init_text,
         enable_history_search=True,
         completer=completer,
         vi_mode=True,
-        bottom_toolbar=lambda: toolbar(shell)
+        bottom_toolbar=Toolbar(shell)
     )
     return session, shell
 
@@ -54,32 +62,51 @@ def step(session, shell):
         cmd = session.prompt(shell.prompt)
         try:
             run_command(cmd, shell)
-            session.rprompt = Text(rprompt_default)
+            session.rprompt = rprompt_default_text
         except ShellError as e:
             print(e)
-            session.rprompt = Text(rprompt_error)
+            session.rprompt = rprompt_error_text
     except KeyboardInterrupt:
         pass
     except EOFError:
         sys.exit(1)
 
 
-def toolbar(shell: Shell, text='Run any command to show info'):
-    method = shell.last_method()
-    if method:
-        text = generate_help(method)
+class Toolbar:
+    """A bottom toolbar that shows info about the last method.
+    The text is only regenerated when the last method changes.
+    """
+
+    def __init__(self, shell: Shell, text='Run any command to show info'):
+        self.shell = shell
+        self.default = Text(text)
+        self.method = None
+        self.text = self.default
 
-    return Text(text)
+    def __call__(self) -> Text:
+        method = self.shell.last_method()
+        if method != self.method:
+            self.method = method
+            self.text = Text(generate_help(method)) if method else self.default
 
+        return self.text
 
+
+@lru_cache(maxsize=256)
 def generate_help(func):
     synopsis = infer_synopsis(func)
     full_text = synopsis
     if func.__doc__:
         full_text += f'  |  {func.__doc__}'
 
-    # keep the first few lines
-    return '\n'.join(full_text.split('\n')[:3])
+    # keep the first few lines, without splitting the full docstring
+    end = -1
+    for _ in range(3):
+        end = full_text.find('\n', end + 1)
+        if end == -1:
+            return full_text
+
+    return full_text[:end]
 
 
 if __name__ == '__main__':
@@ -6,7 +6,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 import plot
-from data_science.random_walk import random_walk, geometric_random_walk
+from data_science.random_walk import geometric_random_walk
 
 plt.style.use('./sci.mplstyle')
 np.random.seed(123)
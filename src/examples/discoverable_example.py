@@ -1,6 +1,5 @@
 #!/usr/bin/python3
 from dataclasses import dataclass
-from json import dumps
 from random import randint
 from typing import Dict, List
 import pandas as pd
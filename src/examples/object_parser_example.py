@@ -4,10 +4,8 @@ if __name__ == '__main__':
 
 from dataclasses import dataclass
 from enum import auto, Enum
-from json import dumps
 from typing import Dict, List
 
-from object_parser.oas import OAS, path_create
 from object_parser import JSONFactory
 from object_parser.spec import Spec
 from object_parser.errors import SpecError
@@ -156,6 +154,9 @@ example_data = {
 
 
 if __name__ == '__main__':
+    from json import dumps
+    from object_parser.oas import OAS, path_create
+
     if 0:
         org = Organization(example_data)
     else:
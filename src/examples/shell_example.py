@@ -3,10 +3,8 @@ if __name__ == '__main__':
     import _extend_path
 
 import sys
-import rich
 from shell.shell import Function, Shell, has_input, set_cli_args, sh_to_py, main
 from io_util import has_output
-import cli
 
 
 def f(x: int): return x
@@ -29,6 +27,8 @@ def inspect(func_name):
     """Inspect a function
     based on rich.inspect
     """
+    import rich
+
     func = Shell.get_method(func_name)
     if func is None:
         return
@@ -56,4 +56,5 @@ if __name__ == '__main__':
         main(functions=functions)
     else:
         # use_shell_with_history:
+        import cli
         cli.main(functions=functions)
@@ -1,9 +1,8 @@
 #!/usr/bin/python3
 from pickle import dumps, loads
-from typing import Callable,  Union
-from copy import deepcopy
+from typing import Callable,  Union, get_origin
 
-from util import has_annotations, has_method, infer_inner_cls, is_Dict, is_Dict_or_List
+from util import has_annotations, has_keys, has_method, infer_inner_cls, is_Dict, is_Dict_or_List
 from filesystem import FileSystem
 from filesystem.view import Data, Path, Key, View
 
@@ -12,6 +11,9 @@ Method = Union[Callable[[FileSystem, Key, Data, View], Data], str]
 
 default_snapshot_filename = '.snapshot.pickle'
 
+# a sentinel for absent initial values, which may themselves be None
+MISSING = object()
+
 
 class Discoverable(FileSystem):
     def __init__(self, *args,
@@ -59,8 +61,8 @@ class Discoverable(FileSystem):
                 return
 
         initial_values_key = infer_initial_value_key(k, cwd)
-        if initial_values_key in self.initial_values:
-            initial_value = self.initial_values[initial_values_key]
+        initial_value = self.initial_values.get(initial_values_key, MISSING)
+        if initial_value is not MISSING:
             # cwd.set(k, initial_value)
             self.set(k, initial_value, cwd)
 
@@ -112,8 +114,7 @@ class Discoverable(FileSystem):
         cwd.set(k, observed_value)
 
         initial_values_key = infer_initial_value_key(k, cwd)
-        if initial_values_key not in self.initial_values:
-            self.initial_values[initial_values_key] = initial_value
+        self.initial_values.setdefault(initial_values_key, initial_value)
 
     def show(self, *path: str):
         # TODO keys in path are not autocompleted
@@ -128,10 +129,9 @@ class Discoverable(FileSystem):
             return data
 
         p = '/'.join(path)
-        if p in self.initial_values:
-            cls = self.initial_values[p]
-            if has_method(cls, 'show'):
-                return cls.show(data)
+        cls = self.initial_values.get(p)
+        if has_method(cls, 'show'):
+            return cls.show(data)
 
         return data
 
@@ -140,13 +140,13 @@ class Discoverable(FileSystem):
 
         for k in list(data.keys()):
             child = self.get(path + [k], relative=False)
-            if not has_method(child, 'keys'):
+            if not has_keys(child):
                 continue
 
             for child_key in list(child.keys()):
                 grand_child = self.get(path + [k, child_key], relative=False)
 
-                if not has_method(grand_child, 'keys'):
+                if not has_keys(grand_child):
                     continue
 
                 for grand_child_key in list(grand_child.keys()):
@@ -160,8 +160,8 @@ def observe(repository: FileSystem, k: Key, initial_value=None, cwd: View = None
     data = initial_value
 
     # infer element types for Dict and List containers
-    if is_Dict_or_List(data):
-        container_cls = dict if is_Dict(data) else list
+    container_cls = get_origin(data)
+    if container_cls is dict or container_cls is list:
         cls = infer_inner_cls(data)
     else:
         container_cls = None
@@ -170,10 +170,10 @@ def observe(repository: FileSystem, k: Key, initial_value=None, cwd: View = None
     if isinstance(cls, type):
         return discover_using_cls(cls, k, container_cls, repository.full_path)
 
-    initial_values_key = '/'.join([str(v) for v in cwd.path + [k]])
+    initial_values_key = infer_initial_value_key(k, cwd)
+    obj = repository.initial_values.get(initial_values_key, MISSING)
 
-    if initial_values_key and initial_values_key in repository.initial_values:
-        obj = repository.initial_values[initial_values_key]
+    if obj is not MISSING:
         cls = obj
         is_directory = is_Dict(cls)
         if is_Dict_or_List(cls):
@@ -218,7 +218,8 @@ def discover_using_cls(cls: type, k: Key, container_cls: type, full_path):
             return items
         elif container_cls is list:
             # assume that all keys are unique
-            return {k: deepcopy(cls) for k in items}
+            # note that types are immutable, such that they can be shared
+            return dict.fromkeys(items, cls)
 
         return items
 
@@ -2,12 +2,12 @@
 """A filesystem-like interface for static and dynamic data.
 This can be used to e.g. browse REST APIs.
 """
+from copy import copy
 from enum import Enum
 from pickle import dumps, loads
-from pprint import pformat
 from typing import Callable, Iterable, List, Tuple, Union
 
-from util import accumulate_list, first, has_method, is_Dict_or_List, none
+from util import first, has_keys, is_Dict_or_List, none
 from filesystem.view import NAME, Key, Path, View
 
 HIDE_PREFIX = '.'
@@ -25,12 +25,8 @@ class Option(Enum):
 
     @staticmethod
     def verify(value):
-        try:
-            Option(value)
-        except ValueError:
-            # failed conversion implies that `value` was not an Option
-            return False
-        return True
+        # avoid the exception that is raised by a failed conversion
+        return isinstance(value, Option) or value in OPTIONS
 
 
 OPTIONS = [o.value for o in Option]
@@ -79,11 +75,12 @@ class FileSystem:
 
     @property
     def path(self) -> Path:
-        if self.in_home():
+        path = self.state.path
+        if self.in_home(path):
             i = len(self._home)
-            return self.state.path[i:]
+            return path[i:]
 
-        return self.full_path
+        return [Option.root.value] + path
 
     @property
     def full_path(self) -> Path:
@@ -99,12 +96,13 @@ class FileSystem:
         """
         return self.state.copy()
 
-    def in_home(self) -> bool:
+    def in_home(self, path: Path = None) -> bool:
         """Check whether home is in cwd.
         """
-        path = self.state.path
-        return len(path) >= len(self._home) and \
-            all(path[i] == k for i, k in enumerate(self._home))
+        if path is None:
+            path = self.state.path
+
+        return path[:len(self._home)] == self._home
 
     def cp(self, *references: Key):
         """Copy references.
@@ -132,6 +130,9 @@ class FileSystem:
         self.state.mv(*references)
 
     def tree(self, *path: str) -> str:
+        # defer this import, because tree is rarely used
+        from pprint import pformat
+
         cwd = self.get(path)
         return pformat(cwd, indent=2)
 
@@ -210,9 +211,16 @@ class FileSystem:
         """Convert indices in path to semantic values.
         """
         result = self.path
-        for i, path in enumerate(accumulate_list(self.path)):
-            *path, key = path
-            result[i] = self.infer_key_name(path, key, relative=False)
+        trace = self.state.trace
+
+        # align the trace with the path, which is either prefixed by the root
+        # or relative to home
+        offset = len(result) - len(trace)
+
+        for i in range(max(0, offset), len(result)):
+            key, parent = trace[i - offset]
+            if isinstance(key, int):
+                result[i] = infer_name(parent[key])
 
         return result
 
@@ -238,7 +246,9 @@ class FileSystem:
         if post_cd_hook is None:
             post_cd_hook = self.post_cd_hook
 
-        fs = FileSystem(self.root, self.home, self.get_hook, post_cd_hook)
+        # avoid the constructor, which would change directory to home
+        fs = copy(self)
+        fs.post_cd_hook = post_cd_hook
         fs.state = self.state.copy()
         fs.prev = self.prev.copy()
         return fs
@@ -256,18 +266,7 @@ class FileSystem:
     def infer_key_name(self, path: Path, k: Key, relative=True) -> str:
         if isinstance(k, int):
             value = self.get(list(path) + [k], relative=relative)
-
-            try:
-                if NAME in value:
-                    return value[NAME]
-            except TypeError:
-                pass
-
-            value = str(value)
-            n = 100
-            if len(value) > n:
-                return value[:n] + '..'
-            return value
+            return infer_name(value)
         return str(k)
 
     def cd_step(self, k: Key):
@@ -340,7 +339,7 @@ class FileSystem:
 
             result = self.get(path)
 
-            if has_method(result, 'keys'):
+            if has_keys(result):
                 results = result.keys()
             elif isinstance(result, str):
                 results = [result]
@@ -354,3 +353,19 @@ class FileSystem:
                     results = [result]
 
             yield from results
+
+
+def infer_name(value) -> str:
+    """Return a semantic name for a value, e.g. an item in a list.
+    """
+    try:
+        if NAME in value:
+            return value[NAME]
+    except TypeError:
+        pass
+
+    value = str(value)
+    n = 100
+    if len(value) > n:
+        return value[:n] + '..'
+    return value
@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 import logging
 from typing import Any, Iterable, List, Tuple, Union
 
-from util import crop, find_fuzzy_matches, find_prefix_matches, is_digit, take, is_Dict_or_List
+from util import crop, find_fuzzy_matches, is_digit, list_prefix_matches, take, is_Dict_or_List
 
 Key = Union[str, int]
 Data = Union[dict, list]
@@ -35,7 +35,8 @@ class View:
 
     @property
     def path(self) -> Path:
-        return [k for k, _ in self.trace]
+        # read the internal field, because the keys are copied anyway
+        return [k for k, _ in self._trace]
 
     def up(self) -> Key:
         """Change view the parent directory.
@@ -99,42 +100,51 @@ class View:
                 del self.tree[src]
 
     def copy(self):
-        trace = []
-        # copy inner values to avoid side-effects of mutated tuples
-        for k, ref in self._trace:
-            trace.append((k, ref))
-
-        return View(self.tree, trace)
+        # the items of the trace are immutable tuples, such that they can be
+        # shared
+        return View(self.tree, list(self._trace))
 
     ############################################################################
     # Internals
     ############################################################################
 
     def infer_index(self, key: Key):
-        if is_digit(key):
+        if isinstance(key, int):
+            return key
+        elif is_digit(key):
             return int(key)
 
-        items = self.ls()
         try:
-            names = [item[NAME] for item in items]
-        except TypeError:
-            names = list(map(str, items))
+            names = [item[NAME] for item in self.tree]
+        except (KeyError, TypeError):
+            names = list(map(str, self.ls()))
 
-        if key not in names:
+        try:
+            return names.index(key)
+        except ValueError:
             logging.info(f'Dir {key} is not present in `ls()`')
 
         match = next(find_fuzzy_matches(key, names))
         return names.index(match)
 
     def _get_from_dict(self, k):
-        try:
-            if k not in self.tree:
-                keys = self.ls()
-                k = next(find_prefix_matches(str(k), keys))
+        if type(self.tree) is dict:
+            # a plain dict has no __missing__, so a single probe suffices
+            try:
+                return k, self.tree[k]
+            except KeyError:
+                pass
+
+        elif k in self.tree:
+            return k, self.tree[k]
 
+        try:
+            # skip find_prefix_matches, because its error would be discarded
+            keys = self.ls()
+            k = next(list_prefix_matches(str(k), keys))
             return k, self.tree[k]
 
-        except (KeyError, ValueError):
+        except (KeyError, StopIteration):
             raise ValueError(self._file_not_found(k))
 
     def _get_from_list(self, k):
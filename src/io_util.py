@@ -44,7 +44,8 @@ def confirm(msg='Continue [Y/n]? '):
 
 
 def print_shell_ready_signal():
-    print(shell_ready_signal)
+    # write directly, because this is called after every command
+    sys.stdout.write(shell_ready_signal + '\n')
     sys.stdout.flush()
 
 
@@ -103,8 +104,9 @@ def allow_all_args():
 
 
 def python_is_run_in_test_mode() -> bool:
-    return 'pytest' in sys.modules.keys() or \
-        ('unittest' in sys.modules.keys() and 'nltk' not in sys.modules.keys())
+    # note that other modules (e.g. matplotlib) import unittest as well
+    # `python -m unittest` sets sys.argv[0] to e.g. 'python -m unittest'
+    return 'pytest' in sys.modules.keys() or 'unittest' in sys.argv[0]
 
 
 class ArgparseWrapper:
@@ -209,10 +211,11 @@ def check_output(line: str) -> str:
     """
     result = subprocess.run(line, capture_output=True, shell=True)
 
-    msg = result.stdout.decode(), result.stderr.decode()
-    assert result.returncode == 0, msg
+    # only decode the error message on failure
+    assert result.returncode == 0, (result.stdout.decode(),
+                                    result.stderr.decode())
 
-    return result.stdout.decode().rstrip('\n')
+    return result.stdout.rstrip(b'\n').decode()
 
 
 set_verbosity()
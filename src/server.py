@@ -1,4 +1,3 @@
-from http.client import BAD_REQUEST
 from flask import Flask, request
 from http import HTTPStatus
 from werkzeug.utils import secure_filename
@@ -1,13 +1,13 @@
 from braceexpand import braceexpand, UnbalancedBracesError
 from dataclasses import dataclass
 from enum import Enum
-from functools import partial
+from functools import lru_cache, partial
 from itertools import accumulate, dropwhile, takewhile
-from nltk.metrics.distance import edit_distance
 from operator import contains
 from queue import Queue
-from typing import Any, Callable, Dict, Generator, Iterable, List, MappingView, Sequence, Tuple, TypeVar, Union
+from typing import Any, Callable, Dict, Generator, Iterable, List, MappingView, Sequence, Tuple, TypeVar, Union, get_origin
 import fnmatch
+import re
 import sys
 import traceback
 
@@ -19,6 +19,12 @@ T = TypeVar('T')
 AdjacencyList = Dict[str, List[str]]
 GLOB_CHARS = '?*{}[]'
 
+# letters, digits or underscores
+WORD_PATTERN = re.compile(r'\w+')
+
+# the index of the inner (value) type of generic containers
+INNER_CLS_INDICES = {dict: 1, list: 0}
+
 
 class DataClassHelper:
     """Methods that mutate dataclass fields.
@@ -81,17 +87,17 @@ def decorate(decoratee: dataclass, cls: object):
 
 
 def infer_dependencies(known_deps: AdjacencyList, key: str):
-    if key not in known_deps:
+    deps = known_deps.get(key)
+    if deps is None:
         return
 
     # yield direct dependencies
-    if key in known_deps:
-        yield from known_deps[key]
+    yield from deps
 
     # yield indirect dependencies
-        for other_key in known_deps[key]:
-            direct_dependencies = infer_dependencies(known_deps, other_key)
-            yield from direct_dependencies
+    for other_key in deps:
+        direct_dependencies = infer_dependencies(known_deps, other_key)
+        yield from direct_dependencies
 
 
 def crop(s: str, n=100, suffix='..') -> str:
@@ -308,6 +314,9 @@ def find_fuzzy_matches(element: str, elements: List[str]):
     """Yield elements that are most similar.
     Similarity is based on the Levenshtein edit-distance.
     """
+    # defer this import, because nltk is slow to import
+    from nltk.metrics.distance import edit_distance
+
     if element in elements:
         # yield eagerly
         yield element
@@ -345,15 +354,19 @@ def list_prefix_matches(element: str, elements: List[str]):
     """Yields all elements that are equal to a prefix of `element`.
     Elements with better matches are chosen first.
     """
+    # only elements that share the first character can match any prefix
+    candidates = [other for other in elements
+                  if isinstance(other, str) and other.startswith(element[:1])]
+
     prev_matches = set()
     for i in range(max(1, len(element)), 0, -1):
         prefix = element[:i]
-        for other in elements:
+        for other in candidates:
             if other in prev_matches:
                 continue
 
             if other.startswith(prefix):
-                prev_matches |= {other}
+                prev_matches.add(other)
                 yield other
 
 
@@ -402,6 +415,13 @@ def has_method(cls, method) -> bool:
     return hasattr(cls, method) and is_callable(getattr(cls, method))
 
 
+def has_keys(obj) -> bool:
+    """Return True if obj is a dict or has a method `keys`.
+    """
+    # skip the attribute lookups for the common case
+    return isinstance(obj, dict) or has_method(obj, 'keys')
+
+
 def is_callable(method) -> bool:
     return hasattr(method, '__call__')
 
@@ -414,11 +434,11 @@ def is_enum(cls: type) -> bool:
 
 
 def infer_inner_cls(cls=Dict[str, str]):
-    if cls._name == 'Dict':
-        return cls.__args__[1]
-    elif cls._name == 'List':
-        return cls.__args__[0]
-    raise NotImplementedError()
+    i = INNER_CLS_INDICES.get(get_origin(cls))
+    if i is None:
+        raise NotImplementedError()
+
+    return cls.__args__[i]
 
 
 def extract_exception():
@@ -515,11 +535,24 @@ def call(f, *_):
 
 
 def is_alpha(key: str, ignore=[]) -> bool:
-    return all(c.isalpha() or c in ignore for c in key)
+    key = omit_chars(key, ignore)
+    return not key or key.isalpha()
 
 
 def is_alphanumerical(key: str, ignore=[]) -> bool:
-    return all(c.isalnum() or c in ignore for c in key)
+    key = omit_chars(key, ignore)
+    return not key or key.isalnum()
+
+
+def omit_chars(key: str, chars: Iterable[str] = []) -> str:
+    if not chars:
+        return key
+    return key.translate(deletion_table(''.join(chars)))
+
+
+@lru_cache
+def deletion_table(chars: str) -> dict:
+    return str.maketrans('', '', chars)
 
 
 def is_digit(s: str) -> bool:
@@ -530,24 +563,25 @@ def is_digit(s: str) -> bool:
         return False
     
 def is_Dict(cls):
-    return getattr(cls, '_name', '') == 'Dict'
+    return get_origin(cls) is dict
 
 def is_List(cls):
-    return getattr(cls, '_name', '') == 'List'
+    return get_origin(cls) is list
 
 def is_Dict_or_List(cls):
-    return is_Dict(cls) or is_List(cls)
+    return get_origin(cls) in INNER_CLS_INDICES
 
 def is_globbable(value: str) -> bool:
     return for_any(GLOB_CHARS, contains, value)
 
 
 def is_valid_method_name(value: str) -> bool:
-    try:
-        return is_alpha(value[0]) and is_alphanumerical(value, ignore='_')
-    except TypeError:
+    if not isinstance(value, str):
         return False
 
+    # the first character must be a letter
+    return value[:1].isalpha() and WORD_PATTERN.fullmatch(value) is not None
+
 
 def has_annotations(cls: type) -> bool:
     # hasattr is necessary for < 3.10
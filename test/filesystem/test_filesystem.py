@@ -0,0 +1,53 @@
+from filesystem import FileSystem
+
+
+def init_fs():
+    return FileSystem({'worlds': [
+        {'name': 'earth',
+         'animals': [{'name': 'terrestrial'},
+                     {'name': 'aquatic', 'penguins': [{'name': 'tux'}]}]}]})
+
+
+def test_semantic_path():
+    fs = init_fs()
+    fs.cd('worlds', 'earth', 'animals', 'aquatic')
+    assert fs.path == ['worlds', 0, 'animals', 1]
+    assert fs.semantic_path == ['worlds', 'earth', 'animals', 'aquatic']
+
+
+def test_semantic_path_relative_to_home():
+    fs = init_fs()
+    fs.init_home(['worlds', 'earth'])
+    fs.cd('animals', 'aquatic', 'penguins', 'tux')
+    assert fs.semantic_path == ['animals', 'aquatic', 'penguins', 'tux']
+
+    fs.cd('/', 'worlds')
+    assert fs.semantic_path == ['/', 'worlds']
+
+
+def test_copy_below_home():
+    fs = init_fs()
+    fs.init_home(['worlds', 'earth'])
+    fs.cd('animals', 'aquatic')
+    fs.cd('penguins')
+
+    path = fs.path
+    full_path = fs.full_path
+    prev_path = fs.prev.path
+
+    fs_copy = fs.copy()
+    assert fs_copy.path == path
+    assert fs_copy.full_path == full_path
+    assert fs_copy.home == fs.home
+
+    fs_copy.cd('/')
+    assert fs_copy.full_path == ['/']
+    assert fs.path == path
+    assert fs.full_path == full_path
+    assert fs.prev.path == prev_path
+
+
+def test_cd_with_mixed_keys():
+    fs = FileSystem({'abc': {}, 5: {}})
+    fs.cd('ab')
+    assert fs.path == ['abc']
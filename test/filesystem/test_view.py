@@ -0,0 +1,48 @@
+from collections import defaultdict
+
+from pytest import raises
+
+from filesystem.view import View
+
+
+def init_view():
+    return View({'snakes': [{'name': 'python'}, {'name': 'cobra'}],
+                 'numbers': [1, 2, 3]})
+
+
+def test_view_get_from_list_by_name():
+    view = init_view()
+    view.down('snakes')
+    assert view.get('cobra') == (1, {'name': 'cobra'})
+    assert view.get('pyth') == (0, {'name': 'python'})
+    assert view.get('1') == (1, {'name': 'cobra'})
+
+
+def test_view_get_from_list_by_index():
+    view = init_view()
+    view.down('numbers')
+    assert view.get('2') == (2, 3)
+
+    with raises(ValueError):
+        view.get('5')
+
+
+def test_view_get_from_dict():
+    view = init_view()
+    assert view.get('snakes') == ('snakes', view.tree['snakes'])
+    assert view.get('num') == ('numbers', [1, 2, 3])
+
+    with raises(ValueError):
+        view.get('x')
+
+
+def test_view_get_from_defaultdict():
+    tree = defaultdict(int, {'alpha': 1})
+    view = View(tree)
+    assert view.get('alpha') == ('alpha', 1)
+    assert view.get('al') == ('alpha', 1)
+
+    with raises(ValueError):
+        view.get('x')
+
+    assert list(tree) == ['alpha']
@@ -1,7 +1,9 @@
+from collections import Counter
 from operator import contains, eq
+from typing import Dict, List
 from pytest import raises
 
-from util import concat, constant, equals, find_prefix_matches, find_fuzzy_matches, for_all, for_any, glob, identity, is_alpha, is_digit, list_prefix_matches, not_equals, split, split_sequence, split_tips
+from util import concat, constant, equals, find_prefix_matches, find_fuzzy_matches, for_all, for_any, glob, has_keys, identity, infer_dependencies, infer_inner_cls, is_alpha, is_digit, is_Dict, is_Dict_or_List, is_List, is_valid_method_name, list_prefix_matches, not_equals, split, split_sequence, split_tips
 
 
 def test_concat_empty_container():
@@ -149,10 +151,16 @@ def test_list_prefix_matches_fuzzy():
     assert list(list_prefix_matches('ba', ['abc'])) == []
 
 
+def test_list_prefix_matches_mixed_keys():
+    assert list(list_prefix_matches('ab', ['abc', 5])) == ['abc']
+
+
 def test_find_prefix_matches_all():
     assert list(find_prefix_matches('a', ['c', 'b', 'a'])) == ['a']
     assert list(find_prefix_matches('a', ['aa', 'ai'])) == ['aa', 'ai']
     assert list(find_prefix_matches('ab', ['aa', 'ab'])) == ['ab', 'aa']
+    assert list(find_prefix_matches('abc', ['b', 'a', 'abd', 'ab'])) == [
+        'abd', 'ab', 'a']
 
 
 def test_glob_with_options():
@@ -203,6 +211,55 @@ def test_is_alpha():
     assert is_alpha('abc')
     assert not is_alpha('-')
     assert is_alpha('-', ignore='-')
+    assert is_alpha('a_b', ignore=['_'])
+    assert is_alpha('__', ignore='_')
+    assert is_alpha('')
+    assert not is_alpha('a1_', ignore='_')
+
+
+def test_infer_dependencies():
+    deps = {'a': ['b'], 'b': ['c', 'd']}
+    assert list(infer_dependencies(deps, 'a')) == ['b', 'c', 'd']
+    assert list(infer_dependencies(deps, 'b')) == ['c', 'd']
+    assert list(infer_dependencies(deps, 'c')) == []
+
+
+def test_is_Dict_or_List():
+    assert is_Dict(Dict[str, int])
+    assert is_List(List[int])
+    assert is_Dict_or_List(Dict[str, int])
+    assert not is_Dict(List[int])
+    assert not is_Dict_or_List({'a': 1})
+    assert not is_Dict_or_List([1])
+    assert not is_Dict_or_List(int)
+
+
+def test_infer_inner_cls():
+    assert infer_inner_cls(Dict[str, int]) == int
+    assert infer_inner_cls(List[float]) == float
+
+    with raises(NotImplementedError):
+        infer_inner_cls(int)
+
+
+def test_is_valid_method_name():
+    assert is_valid_method_name('a')
+    assert is_valid_method_name('do_a1')
+    assert not is_valid_method_name('')
+    assert not is_valid_method_name('_a')
+    assert not is_valid_method_name('1a')
+    assert not is_valid_method_name('\u00b2a')
+    assert not is_valid_method_name('a-b')
+    assert not is_valid_method_name(None)
+    assert not is_valid_method_name(['a'])
+    assert not is_valid_method_name(('a',))
+
+
+def test_has_keys():
+    assert has_keys({})
+    assert has_keys(Counter())
+    assert not has_keys([])
+    assert not has_keys('keys')
 
 
 def test_is_digit():